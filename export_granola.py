@@ -9,12 +9,31 @@ https://github.com/rileycx/granola-export
 """
 
 import argparse
+import atexit
+import io
 import json
+import mmap
 import os
 import re
+import shlex
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Paths (default to current user's home directory)
 HOME = os.path.expanduser("~")
@@ -22,44 +41,128 @@ CACHE_PATH = os.path.join(HOME, "Library/Application Support/Granola/cache-v3.js
 EXPORT_DIR = os.path.join(HOME, "granola-export")
 MEETINGS_DIR = os.path.join(EXPORT_DIR, "meetings")
 INDEX_PATH = os.path.join(EXPORT_DIR, "index.json")
+IDS_PATH = os.path.join(EXPORT_DIR, "exported_ids.txt")
 CONFIG_PATH = os.path.join(HOME, ".granola-export-config.json")
 LOG_PATH = os.path.join(EXPORT_DIR, "export.log")
 
+# Timestamp format for log lines and sync commit messages
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Process umask, read once at import while single-threaded; temp files from
+# mkstemp are private, so written files are given the usual mode before rename
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Export log handle, opened on first use and closed at exit
+_log_file = None
+
+# Meeting files are written concurrently by this many threads
+WRITE_WORKERS = 8
+
+# Granola timestamps are ISO 8601, so the date is their first 10 characters
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Filename slug patterns
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+
+# JSON helpers use orjson when it's installed. The backend is picked once
+# here rather than on every call, since json_dumps runs per transcript segment.
+if orjson is not None:
+    _ORJSON_INDENT = orjson.OPT_INDENT_2
+
+    def json_loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj) -> bytes:
+        """Serialize obj to indented UTF-8 JSON."""
+        return orjson.dumps(obj, option=_ORJSON_INDENT)
+else:
+    def json_loads(data):
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+    def json_dumps(obj) -> bytes:
+        """Serialize obj to indented UTF-8 JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def read_json_file(path: str):
+    """Parse a JSON file in one go, memory-mapping it when orjson is installed."""
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            return json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+@contextmanager
+def atomic_open(path: str):
+    """Open a temp file that replaces path once it's written and closed.
+
+    Readers see either the old file or the new one, never a partial write.
+    The temp file has a unique name, so concurrent runs can't publish each
+    other's writes, and it's removed if writing fails.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_atomic(path: str, data: bytes):
+    """Atomically write data to path."""
+    with atomic_open(path) as f:
+        f.write(data)
+
 
 def slugify(text: str, max_length: int = 50) -> str:
     """Convert text to a safe filename slug."""
-    text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text).strip('-')
-    return text[:max_length]
+    text = SLUG_STRIP_RE.sub('', text.lower())
+    return SLUG_DASH_RE.sub('-', text).strip('-')[:max_length]
 
 
-def format_transcript(segments: list) -> list:
-    """Format transcript segments for export."""
-    formatted = []
-    for seg in segments:
-        formatted.append({
-            "speaker": seg.get("source", "unknown"),
-            "text": seg.get("text", ""),
-            "start": seg.get("start_timestamp"),
-            "end": seg.get("end_timestamp"),
-        })
-    return formatted
-
+def build_transcript(segments: list) -> tuple:
+    """Format transcript segments and build the plain text version in one pass.
 
-def get_full_transcript_text(segments: list) -> str:
-    """Get plain text version of transcript for easy searching."""
+    Returns (formatted_segments, transcript_text). The text groups consecutive
+    segments by speaker for easy searching.
+    """
+    formatted = []
     lines = []
+    append_formatted = formatted.append
+    append_line = lines.append
     current_speaker = None
     current_text = []
 
     for seg in segments:
         speaker = seg.get("source", "unknown")
-        text = seg.get("text", "").strip()
+        raw_text = seg.get("text", "")
+        append_formatted({
+            "speaker": speaker,
+            "text": raw_text,
+            "start": seg.get("start_timestamp"),
+            "end": seg.get("end_timestamp"),
+        })
 
+        text = raw_text.strip()
         if speaker != current_speaker:
             if current_text:
-                lines.append(f"[{current_speaker}]: {' '.join(current_text)}")
+                append_line(f"[{current_speaker}]: {' '.join(current_text)}")
             current_speaker = speaker
             current_text = [text] if text else []
         else:
@@ -67,9 +170,19 @@ def get_full_transcript_text(segments: list) -> str:
                 current_text.append(text)
 
     if current_text:
-        lines.append(f"[{current_speaker}]: {' '.join(current_text)}")
+        append_line(f"[{current_speaker}]: {' '.join(current_text)}")
 
-    return "\n\n".join(lines)
+    return formatted, "\n\n".join(lines)
+
+
+def write_meeting(filepath: str, meeting: dict, segments: list):
+    """Build a meeting's transcript and write its export to disk.
+
+    Runs on a writer thread, so the transcript is only materialized while
+    that meeting is being written.
+    """
+    meeting["transcript_segments"], meeting["transcript_text"] = build_transcript(segments)
+    write_atomic(filepath, json_dumps(meeting))
 
 
 def extract_people(doc: dict) -> list:
@@ -82,10 +195,14 @@ def extract_people(doc: dict) -> list:
 
 def log_message(message: str):
     """Append a message to the export log."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _log_file
+    timestamp = time.strftime(TIMESTAMP_FORMAT)
     try:
-        with open(LOG_PATH, 'a') as f:
-            f.write(f"[{timestamp}] {message}\n")
+        if _log_file is None:
+            # Line buffered, so each message reaches disk as it's logged
+            _log_file = open(LOG_PATH, 'a', buffering=1)
+            atexit.register(_log_file.close)
+        _log_file.write(f"[{timestamp}] {message}\n")
     except:
         pass
 
@@ -95,26 +212,12 @@ def load_config() -> dict:
     if not os.path.exists(CONFIG_PATH):
         return {}
     try:
-        with open(CONFIG_PATH, 'r') as f:
-            return json.load(f)
+        with open(CONFIG_PATH, 'rb') as f:
+            return json_loads(f.read())
     except (json.JSONDecodeError, IOError):
         return {}
 
 
-def git_has_changes() -> bool:
-    """Check if export directory has uncommitted git changes."""
-    git_dir = os.path.join(EXPORT_DIR, ".git")
-    if not os.path.exists(git_dir):
-        return False
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        cwd=EXPORT_DIR,
-        capture_output=True,
-        text=True
-    )
-    return bool(result.stdout.strip())
-
-
 def remote_matches_repo(repo: str, url: str) -> bool:
     """Best-effort match of configured repo against git remote url."""
     if not repo or not url:
@@ -152,57 +255,37 @@ def sync_github(config: dict) -> bool:
             print(f"Sync skipped: git remote 'origin' does not match configured repo ({repo}).")
             return False
 
-        # Copy new meeting files from meetings/ to root (repo stores in root)
-        import shutil
-        for filename in os.listdir(MEETINGS_DIR):
-            if filename.endswith('.json'):
-                src = os.path.join(MEETINGS_DIR, filename)
-                dst = os.path.join(EXPORT_DIR, filename)
-                shutil.copy2(src, dst)
-
-        # Stage all changes
-        subprocess.run(
-            ["git", "add", "-A"],
-            cwd=EXPORT_DIR,
-            capture_output=True,
-            check=True
+        # Stage, commit and push in one shell invocation instead of a
+        # subprocess per git command. Meeting files are tracked in place
+        # under meetings/. Exit status 3 means nothing to commit.
+        message = f"Auto-sync: {time.strftime(TIMESTAMP_FORMAT)}"
+        script = (
+            "git add -A -- . ':(exclude)exported_ids.txt' ':(exclude)*.tmp' && "
+            "{ git diff --cached --quiet && exit 3; "
+            f"git commit -q -m {shlex.quote(message)} && "
+            f"git push -q origin {shlex.quote(branch)}; }}"
         )
-
-        # Check if there are changes to commit
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            script,
+            shell=True,
             cwd=EXPORT_DIR,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
 
-        if not result.stdout.strip():
+        if result.returncode == 3:
             log_message("SYNC: No changes to push")
             return True
 
-        # Commit changes
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        subprocess.run(
-            ["git", "commit", "-m", f"Auto-sync: {timestamp}"],
-            cwd=EXPORT_DIR,
-            capture_output=True,
-            check=True
-        )
-
-        # Push to remote
-        subprocess.run(
-            ["git", "push", "origin", branch],
-            cwd=EXPORT_DIR,
-            capture_output=True,
-            check=True
-        )
+        if result.returncode != 0:
+            error = result.stderr.strip() or f"git exited with status {result.returncode}"
+            log_message(f"SYNC ERROR (github): {error}")
+            return False
 
         log_message(f"SYNC: Pushed to GitHub ({repo})")
         return True
 
-    except subprocess.CalledProcessError as e:
-        log_message(f"SYNC ERROR (github): {e.stderr.decode() if e.stderr else str(e)}")
-        return False
     except Exception as e:
         log_message(f"SYNC ERROR (github): {str(e)}")
         return False
@@ -221,7 +304,8 @@ def sync_command(config: dict) -> bool:
             command,
             shell=True,
             cwd=EXPORT_DIR,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
 
@@ -238,20 +322,16 @@ def sync_command(config: dict) -> bool:
 
 
 def run_sync(new_count: int):
-    """Run sync if enabled and there are new exports."""
+    """Run sync if enabled and there are new exports (or the method allows none)."""
     config = load_config()
 
     if not config.get("sync_enabled", False):
         return
 
-    if new_count == 0:
-        log_message("SYNC: Skipped (no new exports)")
-        return
-
     sync_method = config.get("sync_method", "")
 
     if sync_method == "github":
-        if new_count == 0 and not git_has_changes():
+        if new_count == 0:
             log_message("SYNC: Skipped (no new exports)")
             return
         sync_github(config)
@@ -264,6 +344,133 @@ def run_sync(new_count: int):
         log_message(f"SYNC WARNING: Unknown sync method '{sync_method}'")
 
 
+def load_cache_state(path: str, skip_ids: set) -> tuple:
+    """Load documents and transcripts from the Granola cache.
+
+    Returns (documents, transcripts, transcript_count). Raises ValueError
+    with a user-facing message if the cache can't be read. When ijson is
+    installed, a string-encoded payload is streamed rather than parsed whole.
+    """
+    try:
+        data = read_json_file(path)
+    except json.JSONDecodeError:
+        raise ValueError("Could not parse Granola cache file.")
+
+    cache_blob = data.get('cache', {})
+    if isinstance(cache_blob, str) and ijson is not None:
+        # Payload is itself JSON encoded as a string; stream its bytes so
+        # already exported transcripts are dropped as they're parsed
+        payload = cache_blob.encode('utf-8')
+        del data, cache_blob
+        return stream_cache_state(payload, skip_ids)
+    if isinstance(cache_blob, str):
+        try:
+            inner = json_loads(cache_blob)
+        except json.JSONDecodeError:
+            raise ValueError("Could not parse Granola cache payload.")
+    elif isinstance(cache_blob, dict):
+        inner = cache_blob
+    else:
+        raise ValueError("Granola cache payload has unexpected type.")
+    state = inner.get('state', {})
+
+    documents = state.get('documents', {})
+    transcripts = state.get('transcripts', {})
+
+    if not isinstance(documents, dict) or not isinstance(transcripts, dict):
+        raise ValueError("Granola cache schema changed (documents/transcripts missing).")
+
+    return documents, transcripts, len(transcripts)
+
+
+def ijson_is_map(stream, prefix: str) -> bool:
+    """Check that the value at prefix is a JSON object, or absent."""
+    stream.seek(0)
+    for path, event, _ in ijson.parse(stream):
+        if path == prefix:
+            return event == 'start_map'
+    return True
+
+
+def stream_cache_state(payload: bytes, skip_ids: set) -> tuple:
+    """Stream documents and transcripts from the cache payload with ijson.
+
+    Only transcripts for documents not in skip_ids are kept, so already
+    exported meetings never stay resident in memory.
+    """
+    stream = io.BytesIO(payload)
+    try:
+        documents = dict(ijson.kvitems(stream, "state.documents", use_float=True))
+        stream.seek(0)
+        transcripts = {}
+        transcript_count = 0
+        for doc_id, segments in ijson.kvitems(stream, "state.transcripts", use_float=True):
+            transcript_count += 1
+            if doc_id in documents and doc_id not in skip_ids:
+                transcripts[doc_id] = segments
+
+        # kvitems yields nothing for a non-object, so tell that apart from empty
+        if (not documents and not ijson_is_map(stream, "state.documents")) or \
+                (not transcript_count and not ijson_is_map(stream, "state.transcripts")):
+            raise ValueError("Granola cache schema changed (documents/transcripts missing).")
+    except ijson.JSONError:
+        raise ValueError("Could not parse Granola cache payload.")
+
+    return documents, transcripts, transcript_count
+
+
+def load_index():
+    """Load (meetings, ids) from the existing index, or None if it's unreadable."""
+    if not os.path.exists(INDEX_PATH):
+        return [], set()
+    try:
+        meetings = read_json_file(INDEX_PATH).get("meetings", [])
+        return meetings, set(map(itemgetter("id"), meetings))
+    except (json.JSONDecodeError, KeyError):
+        print("Could not read existing index, starting fresh")
+        return None
+
+
+def load_exported_ids():
+    """Read exported meeting ids from the ids file, or None if unavailable."""
+    try:
+        # The ids file is written right after the index it mirrors. If the
+        # index is gone or has changed since (edited, checked out, or a run
+        # was interrupted), it has to be read instead.
+        if os.path.getmtime(INDEX_PATH) > os.path.getmtime(IDS_PATH):
+            return None
+        with open(IDS_PATH, 'r') as f:
+            return set(f.read().splitlines())
+    except OSError:
+        return None
+
+
+def write_exported_ids(meetings: list):
+    """Write the ids of indexed meetings to the ids file, one per line."""
+    write_atomic(IDS_PATH, "".join(f"{m['id']}\n" for m in meetings).encode("utf-8"))
+
+
+def has_transcript(segments) -> bool:
+    """Whether a cached transcript has any segments to export."""
+    return isinstance(segments, list) and len(segments) > 0
+
+
+def unexported_ids(documents: dict, existing_ids: set) -> list:
+    """Ids of documents that haven't been exported yet, in cache order."""
+    # The set difference runs in C, so runs with nothing new stop here
+    new_ids = documents.keys() - existing_ids
+    return [doc_id for doc_id in documents if doc_id in new_ids] if new_ids else []
+
+
+def load_cache_or_exit(skip_ids: set) -> tuple:
+    """Load the cache state, exiting with an error message if it can't be read."""
+    try:
+        return load_cache_state(CACHE_PATH, skip_ids)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Export Granola transcripts to JSON.")
     parser.add_argument("--cache-path", default=CACHE_PATH, help="Path to Granola cache JSON")
@@ -274,12 +481,13 @@ def parse_args():
 
 
 def main():
-    global CACHE_PATH, EXPORT_DIR, MEETINGS_DIR, INDEX_PATH, LOG_PATH
+    global CACHE_PATH, EXPORT_DIR, MEETINGS_DIR, INDEX_PATH, IDS_PATH, LOG_PATH
     args = parse_args()
     CACHE_PATH = args.cache_path
     EXPORT_DIR = args.export_dir
     MEETINGS_DIR = os.path.join(EXPORT_DIR, "meetings")
     INDEX_PATH = os.path.join(EXPORT_DIR, "index.json")
+    IDS_PATH = os.path.join(EXPORT_DIR, "exported_ids.txt")
     LOG_PATH = os.path.join(EXPORT_DIR, "export.log")
     # Check if Granola cache exists
     if not os.path.exists(CACHE_PATH):
@@ -288,141 +496,149 @@ def main():
         print("Make sure Granola is installed and you've had at least one meeting.")
         sys.exit(1)
 
+    # Check what's already exported. The ids file is much cheaper to read
+    # than the index, which is only parsed when there's something to add.
+    existing_meetings = None
+    index_readable = True
+    existing_ids = load_exported_ids()
+    if existing_ids is None:
+        loaded = load_index()
+        index_readable = loaded is not None
+        existing_meetings, existing_ids = loaded or ([], set())
+    if existing_ids:
+        print(f"Found {len(existing_ids)} already exported meetings")
+
     # Load cache
     print(f"Loading Granola cache...")
-    try:
-        with open(CACHE_PATH, 'r') as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
-        print("Error: Could not parse Granola cache file.")
-        sys.exit(1)
+    documents, transcripts, transcript_count = load_cache_or_exit(existing_ids)
 
-    cache_blob = data.get('cache', {})
-    if isinstance(cache_blob, str):
-        try:
-            inner = json.loads(cache_blob)
-        except json.JSONDecodeError:
-            print("Error: Could not parse Granola cache payload.")
-            sys.exit(1)
-    elif isinstance(cache_blob, dict):
-        inner = cache_blob
-    else:
-        print("Error: Granola cache payload has unexpected type.")
-        sys.exit(1)
-    state = inner.get('state', {})
-
-    documents = state.get('documents', {})
-    transcripts = state.get('transcripts', {})
-
-    if not isinstance(documents, dict) or not isinstance(transcripts, dict):
-        print("Error: Granola cache schema changed (documents/transcripts missing).")
-        sys.exit(1)
-
-    print(f"Found {len(documents)} documents and {len(transcripts)} transcripts in cache")
+    print(f"Found {len(documents)} documents and {transcript_count} transcripts in cache")
 
     # Create meetings directory
     os.makedirs(MEETINGS_DIR, exist_ok=True)
 
-    # Load existing index to check what's already exported
-    existing_ids = set()
-    existing_meetings = []
-
-    if os.path.exists(INDEX_PATH):
-        try:
-            with open(INDEX_PATH, 'r') as f:
-                existing_index = json.load(f)
-                existing_meetings = existing_index.get("meetings", [])
-                existing_ids = {m["id"] for m in existing_meetings}
-                print(f"Found {len(existing_ids)} already exported meetings")
-        except (json.JSONDecodeError, KeyError):
-            print("Could not read existing index, starting fresh")
+    # Collect not-yet-exported documents up front; on runs with nothing new
+    # the loop below has nothing to do.
+    new_doc_ids = unexported_ids(documents, existing_ids)
+
+    # Before exporting anything, check against the index itself, which the
+    # ids file only mirrors
+    if existing_meetings is None and any(has_transcript(transcripts.get(doc_id)) for doc_id in new_doc_ids):
+        loaded = load_index()
+        if loaded is None:
+            # Start fresh, re-exporting everything as the index is rebuilt
+            index_readable = False
+            existing_meetings, existing_ids = [], set()
+            if ijson is not None:
+                # Streaming dropped transcripts for the ids we had skipped
+                documents, transcripts, transcript_count = load_cache_or_exit(existing_ids)
+        else:
+            existing_meetings, existing_ids = loaded
+        new_doc_ids = unexported_ids(documents, existing_ids)
 
+    new_meetings = []
     new_count = 0
     skipped_no_transcript = 0
-    already_exported = 0
-
-    for doc_id, doc in documents.items():
-        # Skip if already exported
-        if doc_id in existing_ids:
-            already_exported += 1
-            continue
-
-        # Get transcript for this document
-        transcript_data = transcripts.get(doc_id, [])
-
-        # Skip if no transcript
-        if not transcript_data or not isinstance(transcript_data, list) or len(transcript_data) == 0:
-            skipped_no_transcript += 1
-            continue
-
-        title = doc.get("title", "Untitled Meeting")
-        created_at = doc.get("created_at", "")
-
-        # Parse date for filename
-        try:
-            date_obj = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            date_str = date_obj.strftime("%Y-%m-%d")
-        except:
-            date_str = "unknown-date"
-
-        # Create filename using doc_id to ensure uniqueness
-        filename = f"{date_str}_{slugify(title)}_{doc_id[:8]}.json"
-        filepath = os.path.join(MEETINGS_DIR, filename)
-
-        # Build meeting export
-        meeting = {
-            "id": doc_id,
-            "title": title,
-            "date": created_at,
-            "people": extract_people(doc),
-            "summary": doc.get("summary"),
-            "overview": doc.get("overview"),
-            "notes_markdown": doc.get("notes_markdown"),
-            "notes_plain": doc.get("notes_plain"),
-            "chapters": doc.get("chapters"),
-            "transcript_segments": format_transcript(transcript_data),
-            "transcript_text": get_full_transcript_text(transcript_data),
+    already_exported = len(documents) - len(new_doc_ids)
+
+    writes = []
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
+        for doc_id in new_doc_ids:
+            doc = documents[doc_id]
+
+            # Get transcript for this document
+            transcript_data = transcripts.get(doc_id, [])
+
+            # Skip if no transcript
+            if not has_transcript(transcript_data):
+                skipped_no_transcript += 1
+                continue
+
+            title = doc.get("title", "Untitled Meeting")
+            created_at = doc.get("created_at", "")
+            people = extract_people(doc)
+            summary_text = doc.get("summary")
+
+            # Date prefix for filename
+            if isinstance(created_at, str) and ISO_DATE_RE.match(created_at):
+                date_str = created_at[:10]
+            else:
+                date_str = "unknown-date"
+
+            # Create filename using doc_id to ensure uniqueness
+            filename = f"{date_str}_{slugify(title)}_{doc_id[:8]}.json"
+            filepath = os.path.join(MEETINGS_DIR, filename)
+
+            # Build meeting export
+            meeting = {
+                "id": doc_id,
+                "title": title,
+                "date": created_at,
+                "people": people,
+                "summary": summary_text,
+                "overview": doc.get("overview"),
+                "notes_markdown": doc.get("notes_markdown"),
+                "notes_plain": doc.get("notes_plain"),
+                "chapters": doc.get("chapters"),
+            }
+
+            # Write meeting file (with its transcript) in the background
+            writes.append(pool.submit(write_meeting, filepath, meeting, transcript_data))
+
+            # Add to new meetings list
+            new_meetings.append({
+                "id": doc_id,
+                "title": title,
+                "date": created_at,
+                "people": people,
+                "file": f"meetings/{filename}",
+                "has_summary": bool(summary_text),
+                "segment_count": len(transcript_data),
+            })
+
+            new_count += 1
+            print(f"  NEW: {filename}")
+
+    # Surface any failed writes before the index references those files
+    for write in writes:
+        write.result()
+
+    # The index only changes when meetings were added, so steady-state runs
+    # skip re-sorting and re-serializing every already-exported entry. It was
+    # loaded above whenever there was anything to add.
+    if existing_meetings is not None and (new_count or not index_readable or not os.path.exists(INDEX_PATH)):
+        existing_meetings.extend(new_meetings)
+
+        # Existing entries are already sorted, so this is close to linear
+        existing_meetings.sort(key=lambda x: x.get("date", ""), reverse=True)
+
+        # Build updated index
+        index = {
+            "exported_at": datetime.now().isoformat(),
+            "total_documents": len(documents),
+            "total_transcripts": transcript_count,
+            "exported_count": len(existing_meetings),
+            "meetings": existing_meetings
         }
 
-        # Write meeting file
-        with open(filepath, 'w') as f:
-            json.dump(meeting, f, indent=2)
-
-        # Add to existing meetings list
-        existing_meetings.append({
-            "id": doc_id,
-            "title": title,
-            "date": created_at,
-            "people": extract_people(doc),
-            "file": f"meetings/{filename}",
-            "has_summary": bool(doc.get("summary")),
-            "segment_count": len(transcript_data),
-        })
-
-        new_count += 1
-        print(f"  NEW: {filename}")
+        # Write index
+        write_atomic(INDEX_PATH, json_dumps(index))
+        write_exported_ids(existing_meetings)
+    elif existing_meetings is not None:
+        # The index had to be read: the ids file is missing (first run since
+        # upgrading), older than the index, or behind it
+        write_exported_ids(existing_meetings)
 
-    # Sort all meetings by date descending
-    existing_meetings.sort(key=lambda x: x.get("date", ""), reverse=True)
-
-    # Build updated index
-    index = {
-        "exported_at": datetime.now().isoformat(),
-        "total_documents": len(documents),
-        "total_transcripts": len(transcripts),
-        "exported_count": len(existing_meetings),
-        "meetings": existing_meetings
-    }
-
-    # Write index
-    with open(INDEX_PATH, 'w') as f:
-        json.dump(index, f, indent=2)
+    if existing_meetings is not None:
+        total_in_index = len(existing_meetings)
+    else:
+        total_in_index = len(existing_ids)
 
     summary = {
         "new": new_count,
         "already_exported": already_exported,
         "no_transcript": skipped_no_transcript,
-        "total_in_index": len(existing_meetings),
+        "total_in_index": total_in_index,
         "export_dir": EXPORT_DIR,
         "index_path": INDEX_PATH,
     }
@@ -431,7 +647,7 @@ def main():
     print(f"  New: {new_count} meetings exported")
     print(f"  Already exported: {already_exported}")
     print(f"  No transcript: {skipped_no_transcript}")
-    print(f"  Total in index: {len(existing_meetings)}")
+    print(f"  Total in index: {total_in_index}")
 
     # Run sync if enabled
     if not args.no_sync:
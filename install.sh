@@ -271,6 +271,8 @@ CONFIGEOF
         # Create .gitignore for export dir
         cat > "$INSTALL_DIR/.gitignore" << GITIGNOREEOF
 export.log
+exported_ids.txt
+*.tmp
 *.pyc
 __pycache__/
 .DS_Store